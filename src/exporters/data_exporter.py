@@ -1,18 +1,51 @@
 from __future__ import annotations
 
 import csv
+import html
 import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional, faster JSON encoder
+    orjson = None
 
 from utils.helpers import logger
 
+# Output files are written through a 64 KiB buffer to amortize write syscalls.
+_WRITE_BUFFER_SIZE = 1 << 16
+
+if orjson is not None:
+
+    def _dumps(value: Any, pretty: bool = False) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    def _encode_cell(value: Any) -> str:
+        return orjson.dumps(value).decode("utf-8")
+
+else:
+
+    def _dumps(value: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    _encode_cell = json.JSONEncoder(
+        ensure_ascii=False, separators=(",", ":")
+    ).encode
+
 class DataExporter:
     """
     Handles exporting hashtag analytics to multiple formats:
-    JSON, CSV, Excel, and HTML.
+    JSON, JSON Lines, CSV, Excel, and HTML.
     """
 
+    # Shared compact encoder for nested cells; avoids rebuilding one per call.
+    _ENCODER = staticmethod(_encode_cell)
+
     def __init__(self, output_dir: Path) -> None:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -22,116 +55,213 @@ class DataExporter:
         """
         Flatten nested portions of the record to make CSV/Excel output
         easier to consume. Lists and dicts are JSON-encoded.
+
+        Records without nested values are returned as-is; callers treat the
+        result as read-only.
         """
+        if not any(isinstance(value, (list, dict)) for value in record.values()):
+            return record
+
         flat: Dict[str, Any] = {}
 
         for key, value in record.items():
-            if isinstance(value, (list, dict)):
-                flat[key] = json.dumps(value, ensure_ascii=False)
+            if isinstance(value, list):
+                flat[key] = DataExporter._ENCODER(value) if value else "[]"
+            elif isinstance(value, dict):
+                flat[key] = DataExporter._ENCODER(value) if value else "{}"
             else:
                 flat[key] = value
 
         return flat
 
-    def export_json(self, records: Iterable[Dict[str, Any]]) -> Path:
-        records_list = list(records)
+    @staticmethod
+    def _collect_fieldnames(records: Iterable[Dict[str, Any]]) -> List[str]:
+        # Union of keys in first-seen order, which follows the record layout.
+        # Flattening never renames keys, so raw and flat records agree.
+        return list(dict.fromkeys(key for rec in records for key in rec))
+
+    @classmethod
+    def _iter_rows(
+        cls, records: Iterable[Dict[str, Any]], fieldnames: List[str]
+    ) -> Iterator[List[Any]]:
+        """
+        Flatten records lazily into positional rows, so only one flattened
+        row is alive at a time.
+        """
+        for rec in records:
+            flat = cls._prepare_flat_row(rec)
+            yield [flat.get(key, "") for key in fieldnames]
+
+    def export_json(
+        self, records: Iterable[Dict[str, Any]], pretty: bool = False
+    ) -> Path:
+        """
+        Stream records into a JSON array, one record at a time, so the whole
+        dataset never has to be serialized in memory at once. Pass
+        ``pretty=True`` for indented output.
+        """
         output_path = self.output_dir / "hashtags.json"
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(records_list, f, ensure_ascii=False, indent=2)
+        with output_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(b"[\n")
+            f.writelines(
+                chunk
+                for idx, rec in enumerate(records)
+                for chunk in (b",\n" if idx else b"", _dumps(rec, pretty))
+            )
+            f.write(b"\n]\n")
         logger.info("Wrote JSON output to %s", output_path)
         return output_path
 
-    def export_csv(self, records: Iterable[Dict[str, Any]]) -> Path:
-        records_list = list(records)
-        if not records_list:
+    def export_jsonl(self, records: Iterable[Dict[str, Any]]) -> Path:
+        """
+        Write newline-delimited JSON: one compact record per line, with no
+        enclosing array, so the file can be streamed back record by record.
+        """
+        output_path = self.output_dir / "hashtags.jsonl"
+        with output_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines(_dumps(rec) + b"\n" for rec in records)
+        logger.info("Wrote JSON Lines output to %s", output_path)
+        return output_path
+
+    def export_csv(
+        self,
+        records: Iterable[Dict[str, Any]],
+        fieldnames: Optional[List[str]] = None,
+    ) -> Path:
+        if fieldnames is None:
+            records = list(records)  # needs one pass for keys, one for rows
+            fieldnames = self._collect_fieldnames(records)
+        if not fieldnames:
             logger.warning("No records provided to export_csv.")
             return self.output_dir / "hashtags.csv"
 
-        flat_records: List[Dict[str, Any]] = [
-            self._prepare_flat_row(rec) for rec in records_list
-        ]
-
-        fieldnames = sorted({key for rec in flat_records for key in rec.keys()})
-
         output_path = self.output_dir / "hashtags.csv"
-        with output_path.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for rec in flat_records:
-                writer.writerow(rec)
+        with output_path.open(
+            "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(self._iter_rows(records, fieldnames))
 
         logger.info("Wrote CSV output to %s", output_path)
         return output_path
 
-    def export_excel(self, records: Iterable[Dict[str, Any]]) -> Path:
+    def export_excel(
+        self,
+        records: Iterable[Dict[str, Any]],
+        fieldnames: Optional[List[str]] = None,
+    ) -> Path:
+        """
+        Write records to an .xlsx sheet in constant-memory mode, so each row
+        is flushed to disk as soon as it is written.
+        """
         try:
-            import pandas as pd
+            import xlsxwriter
         except ImportError as exc:
             logger.error(
-                "pandas is required for Excel export but is not installed: %s", exc
+                "xlsxwriter is required for Excel export but is not installed: %s",
+                exc,
             )
             raise
 
-        records_list = list(records)
-        if not records_list:
+        if fieldnames is None:
+            records = list(records)  # needs one pass for keys, one for rows
+            fieldnames = self._collect_fieldnames(records)
+        if not fieldnames:
             logger.warning("No records provided to export_excel.")
             return self.output_dir / "hashtags.xlsx"
 
-        flat_records: List[Dict[str, Any]] = [
-            self._prepare_flat_row(rec) for rec in records_list
-        ]
-
-        df = pd.DataFrame(flat_records)
         output_path = self.output_dir / "hashtags.xlsx"
-        df.to_excel(output_path, index=False)
+        workbook = xlsxwriter.Workbook(
+            str(output_path),
+            {
+                "constant_memory": True,
+                # Keep cell text literal: no formula or hyperlink conversion.
+                "strings_to_formulas": False,
+                "strings_to_urls": False,
+            },
+        )
+        try:
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, fieldnames)
+            for row_idx, row in enumerate(
+                self._iter_rows(records, fieldnames), start=1
+            ):
+                worksheet.write_row(row_idx, 0, row)
+        finally:
+            workbook.close()
+
         logger.info("Wrote Excel output to %s", output_path)
         return output_path
 
-    def export_html(self, records: Iterable[Dict[str, Any]]) -> Path:
-        try:
-            import pandas as pd
-        except ImportError as exc:
-            logger.error(
-                "pandas is required for HTML export but is not installed: %s", exc
-            )
-            raise
-
-        records_list = list(records)
-        if not records_list:
+    def export_html(
+        self,
+        records: Iterable[Dict[str, Any]],
+        fieldnames: Optional[List[str]] = None,
+    ) -> Path:
+        """
+        Render records as a static HTML table, streaming one row at a time.
+        """
+        if fieldnames is None:
+            records = list(records)  # needs one pass for keys, one for rows
+            fieldnames = self._collect_fieldnames(records)
+        if not fieldnames:
             logger.warning("No records provided to export_html.")
             return self.output_dir / "hashtags.html"
 
-        flat_records: List[Dict[str, Any]] = [
-            self._prepare_flat_row(rec) for rec in records_list
-        ]
-
-        df = pd.DataFrame(flat_records)
-        html_table = df.to_html(index=False, border=0, classes="hashtag-table")
-
         output_path = self.output_dir / "hashtags.html"
-        with output_path.open("w", encoding="utf-8") as f:
+        with output_path.open(
+            "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as f:
             f.write(
                 "<!DOCTYPE html>\n<html><head><meta charset='utf-8'>"
                 "<title>Hashtag Analytics</title></head><body>\n"
             )
-            f.write(html_table)
-            f.write("\n</body></html>")
+            f.write('<table class="hashtag-table">\n<thead><tr>')
+            f.write("".join(f"<th>{html.escape(key)}</th>" for key in fieldnames))
+            f.write("</tr></thead>\n<tbody>\n")
+            f.writelines(
+                "<tr>"
+                + "".join(
+                    f"<td>{html.escape('' if value is None else str(value))}</td>"
+                    for value in row
+                )
+                + "</tr>\n"
+                for row in self._iter_rows(records, fieldnames)
+            )
+            f.write("</tbody>\n</table>\n</body></html>")
 
         logger.info("Wrote HTML output to %s", output_path)
         return output_path
 
-    def export(self, records: Iterable[Dict[str, Any]], formats: List[str]) -> None:
+    def export(
+        self,
+        records: Iterable[Dict[str, Any]],
+        formats: List[str],
+        pretty: bool = False,
+    ) -> None:
         """
-        Dispatch export to the requested formats.
+        Dispatch export to the requested formats. JSON is written compactly
+        unless ``pretty`` is set.
         """
         formats_set = {fmt.lower() for fmt in formats}
         records_list = list(records)  # we iterate multiple times
 
         if "json" in formats_set:
-            self.export_json(records_list)
-        if "csv" in formats_set:
-            self.export_csv(records_list)
-        if "excel" in formats_set or "xlsx" in formats_set:
-            self.export_excel(records_list)
-        if "html" in formats_set:
-            self.export_html(records_list)
\ No newline at end of file
+            self.export_json(records_list, pretty=pretty)
+        if "jsonl" in formats_set:
+            self.export_jsonl(records_list)
+
+        tabular = formats_set & {"csv", "excel", "xlsx", "html"}
+        if not tabular:
+            return
+
+        # Collect the header once and share it across every tabular format.
+        fieldnames = self._collect_fieldnames(records_list)
+
+        if "csv" in tabular:
+            self.export_csv(records_list, fieldnames)
+        if "excel" in tabular or "xlsx" in tabular:
+            self.export_excel(records_list, fieldnames)
+        if "html" in tabular:
+            self.export_html(records_list, fieldnames)
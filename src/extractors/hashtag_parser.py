@@ -1,17 +1,39 @@
 from __future__ import annotations
 
+import functools
 import json
 import re
-import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional, faster JSON parser
+    _json_loads = json.loads
 
 from utils.helpers import logger, humanize_posts_count
 
-@dataclass
+# Patterns for the JSON payloads Instagram embeds in tag pages. Both embeds
+# are alternatives of one pattern so a single scan finds either of them.
+_PAYLOAD_RE = re.compile(
+    r"window\._sharedData\s*=\s*(?P<shared>\{.*?\});</script>"
+    r"|window\.__additionalDataLoaded\('.*?',\s*(?P<additional>\{.*?\})\);",
+    re.DOTALL,
+)
+_PAYLOAD_LABELS = {
+    "shared": "window._sharedData",
+    "additional": "__additionalDataLoaded",
+}
+_LD_JSON_RE = re.compile(
+    r"<script[^>]*\btype=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.DOTALL | re.IGNORECASE,
+)
+
+@dataclass(slots=True)
 class HashtagStats:
     name: str
     postsCount: int
@@ -20,7 +42,25 @@ class HashtagStats:
     postsPerDay: float
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "postsCount": self.postsCount,
+            "url": self.url,
+            "posts": self.posts,
+            "postsPerDay": self.postsPerDay,
+        }
+
+@dataclass(frozen=True)
+class HashtagPage:
+    """
+    A fetched tag page together with its decoded payload and hashtag node,
+    so every extractor works from a single parse.
+    """
+
+    hashtag: str
+    html: Optional[str]
+    payload: Optional[Dict[str, Any]]
+    node: Optional[Dict[str, Any]]
 
 class HashtagParser:
     """
@@ -35,6 +75,7 @@ class HashtagParser:
         max_retries: int = 3,
         sleep_between_requests: float = 1.0,
         user_agent: str | None = None,
+        pool_maxsize: int = 32,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
@@ -50,44 +91,102 @@ class HashtagParser:
             "Accept-Language": "en-US,en;q=0.9",
         }
 
+        # One pooled, keep-alive session for every request. Retries and
+        # backoff are handled by urllib3; max_retries counts total attempts.
+        # pool_maxsize should be at least the number of concurrent callers,
+        # otherwise urllib3 discards the surplus connections after each use.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_maxsize=max(1, pool_maxsize),
+            max_retries=Retry(
+                total=max(self.max_retries - 1, 0),
+                backoff_factor=self.sleep_between_requests,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Stats, relations and top posts all read the same tag page, so keep
+        # the HTML (or None on failure) per normalized hashtag.
+        self._html_cache: Dict[str, Optional[str]] = {}
+        self._page_cache: Dict[str, HashtagPage] = {}
+
+    @staticmethod
+    def _normalize_hashtag(hashtag: str) -> str:
+        return hashtag.lstrip("#")
+
+    def forget_hashtag(self, hashtag: str) -> None:
+        """
+        Drop cached data for a hashtag once the caller is done with it.
+        """
+        key = self._normalize_hashtag(hashtag)
+        self._html_cache.pop(key, None)
+        self._page_cache.pop(key, None)
+
     def _build_hashtag_url(self, hashtag: str) -> str:
         tag = hashtag.lstrip("#")
         return f"{self.base_url}/explore/tags/{tag}/"
 
     def fetch_hashtag_page(self, hashtag: str) -> Optional[str]:
         """
-        Fetch the raw HTML for a hashtag page, with basic retry logic.
+        Return the raw HTML for a hashtag page, downloading it at most once.
+        """
+        key = self._normalize_hashtag(hashtag)
+        if key in self._html_cache:
+            return self._html_cache[key]
+
+        html = self._download_hashtag_page(hashtag)
+        self._html_cache[key] = html
+        return html
+
+    def get_page(self, hashtag: str) -> HashtagPage:
+        """
+        Return the tag page for a hashtag with its JSON payload and hashtag
+        node already extracted. Built once per hashtag and then reused.
+        """
+        key = self._normalize_hashtag(hashtag)
+        page = self._page_cache.get(key)
+        if page is not None:
+            return page
+
+        html = self.fetch_hashtag_page(hashtag)
+        payload = self._extract_json_from_html(html) if html is not None else None
+        node = self._extract_hashtag_node(payload) if payload else None
+
+        page = HashtagPage(hashtag=hashtag, html=html, payload=payload, node=node)
+        self._page_cache[key] = page
+        return page
+
+    def _download_hashtag_page(self, hashtag: str) -> Optional[str]:
+        """
+        Fetch the raw HTML for a hashtag page. Transient failures are retried
+        with backoff by the session's adapter.
         """
         url = self._build_hashtag_url(hashtag)
-        last_exc: Optional[Exception] = None
 
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                logger.debug("GET %s (attempt %s/%s)", url, attempt, self.max_retries)
-                response = requests.get(
-                    url, headers=self.headers, timeout=self.timeout
-                )
-                if response.status_code == 200:
-                    logger.debug("Received 200 for %s", url)
-                    return response.text
-
-                logger.warning(
-                    "Non-200 response (%s) for %s: %s",
-                    response.status_code,
-                    url,
-                    response.text[:200],
-                )
-            except Exception as exc:
-                last_exc = exc
-                logger.warning("Error fetching %s: %s", url, exc)
-
-            time.sleep(self.sleep_between_requests)
-
-        logger.error(
-            "Failed to fetch hashtag page for %s after %s attempts. Last error: %s",
-            hashtag,
-            self.max_retries,
-            last_exc,
+        try:
+            logger.debug("GET %s", url)
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as exc:
+            logger.error(
+                "Failed to fetch hashtag page for %s after %s attempts. Last error: %s",
+                hashtag,
+                self.max_retries,
+                exc,
+            )
+            return None
+
+        if response.status_code == 200:
+            logger.debug("Received 200 for %s", url)
+            return response.text
+
+        logger.warning(
+            "Non-200 response (%s) for %s: %s",
+            response.status_code,
+            url,
+            response.text[:200],
         )
         return None
 
@@ -97,35 +196,29 @@ class HashtagParser:
         Instagram embeds JSON in one of several ways. This tries a few of the
         more common patterns and returns the best-effort JSON payload.
         """
-        # window._sharedData pattern
-        shared_data_match = re.search(
-            r"window\._sharedData\s*=\s*(\{.*?\});</script>",
-            html,
-            re.DOTALL,
-        )
-        if shared_data_match:
-            try:
-                return json.loads(shared_data_match.group(1))
-            except json.JSONDecodeError:
-                logger.debug("Failed to decode window._sharedData payload.")
-
-        # __additionalDataLoaded pattern
-        additional_match = re.search(
-            r"window\.__additionalDataLoaded\('.*?',\s*(\{.*?\})\);",
-            html,
-            re.DOTALL,
-        )
-        if additional_match:
+        # window._sharedData / __additionalDataLoaded patterns. _sharedData
+        # wins wherever it appears; __additionalDataLoaded is only used when
+        # no _sharedData payload decodes.
+        additional: Optional[Dict[str, Any]] = None
+        for payload_match in _PAYLOAD_RE.finditer(html):
+            kind = payload_match.lastgroup
+            if kind == "additional" and additional is not None:
+                continue
             try:
-                return json.loads(additional_match.group(1))
+                data = _json_loads(payload_match.group(kind))
             except json.JSONDecodeError:
-                logger.debug("Failed to decode __additionalDataLoaded payload.")
+                logger.debug("Failed to decode %s payload.", _PAYLOAD_LABELS[kind])
+                continue
+            if kind == "shared":
+                return data
+            additional = data
+        if additional is not None:
+            return additional
 
         # Fallback: attempt to locate <script type="application/ld+json">
-        soup = BeautifulSoup(html, "html.parser")
-        for script in soup.find_all("script", {"type": "application/ld+json"}):
+        for script_match in _LD_JSON_RE.finditer(html):
             try:
-                data = json.loads(script.text)
+                data = _json_loads(script_match.group(1))
                 if isinstance(data, dict):
                     return data
             except json.JSONDecodeError:
@@ -160,6 +253,7 @@ class HashtagParser:
         return None
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _estimate_posts_per_day(posts_count: int) -> float:
         """
         Rough heuristic for posts per day given only a total count.
@@ -221,15 +315,7 @@ class HashtagParser:
         Main entry point for the rest of the application.
         Returns best-effort statistics for the given hashtag.
         """
-        html = self.fetch_hashtag_page(hashtag)
-        if html is None:
-            return self._fallback_minimal_stats(hashtag)
-
-        payload = self._extract_json_from_html(html)
-        if not payload:
-            return self._fallback_minimal_stats(hashtag)
-
-        node = self._extract_hashtag_node(payload)
+        node = self.get_page(hashtag).node
         if not node:
             return self._fallback_minimal_stats(hashtag)
 
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Tuple
 
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover - optional, faster HTML parser
+    HTMLParser = None
+
 from utils.helpers import logger
-from .hashtag_parser import HashtagParser
+from .hashtag_parser import HashtagPage, HashtagParser
+
+# Upper bound on posts synthesized by the HTML card fallback.
+_MAX_FALLBACK_POSTS = 12
+
+# Only match at the start of a word, so "x@y.com" is not read as a mention.
+# Usernames may contain inner dots.
+_HASHTAG_RE = re.compile(r"(?<!\w)#(\w+)")
+_MENTION_RE = re.compile(r"(?<!\w)@(\w(?:[\w.]*\w)?)")
 
-@dataclass
+@dataclass(slots=True)
 class TopPost:
     id: str
     type: str
@@ -19,7 +33,16 @@ class TopPost:
     url: str
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # The lists are shared rather than copied; records are read-only.
+        return {
+            "id": self.id,
+            "type": self.type,
+            "shortCode": self.shortCode,
+            "caption": self.caption,
+            "hashtags": self.hashtags,
+            "mentions": self.mentions,
+            "url": self.url,
+        }
 
 class PostCollector:
     """
@@ -30,19 +53,6 @@ class PostCollector:
     def __init__(self, parser: HashtagParser) -> None:
         self.parser = parser
 
-    @staticmethod
-    def _extract_json_from_html(html: str) -> Optional[Dict[str, Any]]:
-        # Reuse HashtagParser's JSON extraction to keep behavior consistent.
-        from .hashtag_parser import HashtagParser as HP
-
-        return HP._extract_json_from_html(html)  # type: ignore[attr-defined]
-
-    @staticmethod
-    def _extract_hashtag_node(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        from .hashtag_parser import HashtagParser as HP
-
-        return HP._extract_hashtag_node(payload)  # type: ignore[attr-defined]
-
     @staticmethod
     def _parse_caption(edge: Dict[str, Any]) -> str:
         node = edge.get("node", {})
@@ -54,16 +64,8 @@ class PostCollector:
         return ""
 
     @staticmethod
-    def _parse_hashtags_and_mentions(caption: str) -> (List[str], List[str]):
-        words = caption.split()
-        hashes: List[str] = []
-        mentions: List[str] = []
-        for word in words:
-            if word.startswith("#") and len(word) > 1:
-                hashes.append(word.strip("#").strip())
-            elif word.startswith("@") and len(word) > 1:
-                mentions.append(word.strip("@").strip())
-        return hashes, mentions
+    def _parse_hashtags_and_mentions(caption: str) -> Tuple[List[str], List[str]]:
+        return _HASHTAG_RE.findall(caption), _MENTION_RE.findall(caption)
 
     def _parse_top_posts_from_node(self, node: Dict[str, Any]) -> List[TopPost]:
         """
@@ -106,22 +108,34 @@ class PostCollector:
 
         return posts
 
+    @staticmethod
+    def _iter_post_link_attrs(html: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the attributes of every <a> tag linking to an individual post.
+        Uses selectolax when installed and falls back to BeautifulSoup.
+        """
+        if HTMLParser is not None:
+            for node in HTMLParser(html).css('a[href^="/p/"]'):
+                yield node.attributes
+            return
+
+        soup = BeautifulSoup(html, "html.parser")
+        for a in soup.select('a[href^="/p/"]', limit=_MAX_FALLBACK_POSTS):
+            yield a.attrs
+
     def _fallback_from_html_cards(self, html: str) -> List[TopPost]:
         """
         Very rough HTML fallback: look for <a> tags to individual posts,
         synthesize minimal TopPost records.
         """
-        soup = BeautifulSoup(html, "html.parser")
         posts: List[TopPost] = []
 
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            if not href.startswith("/p/"):
-                continue
-
-            short_code = href.split("/")[2] if len(href.split("/")) > 2 else ""
+        for attrs in self._iter_post_link_attrs(html):
+            href = attrs.get("href") or ""
+            parts = href.split("/", 3)
+            short_code = parts[2] if len(parts) > 2 else ""
             url = f"{self.parser.base_url}{href}"
-            caption = a.get("aria-label") or a.get("title") or ""
+            caption = attrs.get("aria-label") or attrs.get("title") or ""
             hashtags, mentions = self._parse_hashtags_and_mentions(caption)
 
             posts.append(
@@ -136,39 +150,36 @@ class PostCollector:
                 )
             )
 
-            if len(posts) >= 12:
+            if len(posts) >= _MAX_FALLBACK_POSTS:
                 break
 
         return posts
 
-    def collect_top_posts(self, hashtag: str) -> List[TopPost]:
+    def collect_top_posts(self, page: HashtagPage) -> List[TopPost]:
         """
-        Public API: returns a list of TopPost for a given hashtag.
+        Public API: returns a list of TopPost for a fetched hashtag page.
         Always returns a list, possibly empty.
         """
-        html = self.parser.fetch_hashtag_page(hashtag)
-        if html is None:
+        hashtag = page.hashtag
+        if page.html is None:
             logger.info(
                 "No HTML available for hashtag %s, returning empty topPosts.", hashtag
             )
             return []
 
-        payload = self._extract_json_from_html(html)
-        if payload:
-            node = self._extract_hashtag_node(payload)
-            if node:
-                posts = self._parse_top_posts_from_node(node)
-                if posts:
-                    logger.debug(
-                        "Parsed %s top posts for hashtag %s using JSON.",
-                        len(posts),
-                        hashtag,
-                    )
-                    return posts
+        if page.node:
+            posts = self._parse_top_posts_from_node(page.node)
+            if posts:
+                logger.debug(
+                    "Parsed %s top posts for hashtag %s using JSON.",
+                    len(posts),
+                    hashtag,
+                )
+                return posts
 
         # If we get here, structured JSON parsing didn't work; try HTML cards.
         logger.info(
             "Falling back to HTML-based extraction for top posts of hashtag %s.",
             hashtag,
         )
-        return self._fallback_from_html_cards(html)
\ No newline at end of file
+        return self._fallback_from_html_cards(page.html)
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
 from utils.helpers import logger
-from .hashtag_parser import HashtagParser
+from .hashtag_parser import HashtagPage, HashtagParser
 
-@dataclass
+@dataclass(slots=True)
 class RelatedTag:
     name: str
     media_count: int
 
+def _negated_media_count(tag: RelatedTag) -> int:
+    return -tag.media_count
+
 class RelationsMapper:
     """
     Responsible for turning Instagram's "related tags" data into a richer
@@ -21,18 +25,6 @@ class RelationsMapper:
     def __init__(self, parser: HashtagParser) -> None:
         self.parser = parser
 
-    @staticmethod
-    def _extract_json_from_html(html: str) -> Optional[Dict[str, Any]]:
-        from .hashtag_parser import HashtagParser as HP
-
-        return HP._extract_json_from_html(html)  # type: ignore[attr-defined]
-
-    @staticmethod
-    def _extract_hashtag_node(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        from .hashtag_parser import HashtagParser as HP
-
-        return HP._extract_hashtag_node(payload)  # type: ignore[attr-defined]
-
     @staticmethod
     def _collect_related_tags(node: Dict[str, Any]) -> List[RelatedTag]:
         """
@@ -79,35 +71,30 @@ class RelationsMapper:
             }
 
         sorted_tags = sorted(tags, key=lambda t: t.media_count, reverse=True)
-        counts = [t.media_count for t in sorted_tags]
-        max_count = max(counts) or 1
+        max_count = sorted_tags[0].media_count or 1
 
         frequent_threshold = max_count * 0.6
         rare_threshold = max_count * 0.2
 
-        frequent: List[Dict[str, Any]] = []
-        average: List[Dict[str, Any]] = []
-        rare: List[Dict[str, Any]] = []
-
-        for t in sorted_tags:
-            entry = {"hash": f"#{t.name}", "info": t.media_count}
-            if t.media_count >= frequent_threshold:
-                frequent.append(entry)
-            elif t.media_count <= rare_threshold:
-                rare.append(entry)
-            else:
-                average.append(entry)
-
-        # The "related" field is a flat list combining all buckets but with
-        # human-readable info.
-        related_flat: List[Dict[str, Any]] = []
-        for t in sorted_tags:
-            related_flat.append(
-                {
-                    "hash": f"#{t.name}",
-                    "info": t.media_count,
-                }
-            )
+        # The "related" field is a flat list combining all buckets; the
+        # bucket lists below share these same entry dicts.
+        related_flat: List[Dict[str, Any]] = [
+            {"hash": f"#{t.name}", "info": t.media_count} for t in sorted_tags
+        ]
+
+        # Counts are sorted descending, so each bucket is a contiguous slice
+        # whose bounds can be found by bisecting on the negated count.
+        frequent_end = bisect_right(
+            sorted_tags, -frequent_threshold, key=_negated_media_count
+        )
+        rare_start = max(
+            frequent_end,
+            bisect_left(sorted_tags, -rare_threshold, key=_negated_media_count),
+        )
+
+        frequent = related_flat[:frequent_end]
+        average = related_flat[frequent_end:rare_start]
+        rare = related_flat[rare_start:]
 
         # For now, we treat semantic vs literal as the same pool. In a more
         # advanced setup, this is where an embedding model or external
@@ -122,7 +109,7 @@ class RelationsMapper:
             "relatedRare": rare,
         }
 
-    def map_relations(self, hashtag: str) -> Dict[str, List[Dict[str, Any]]]:
+    def map_relations(self, page: HashtagPage) -> Dict[str, List[Dict[str, Any]]]:
         """
         Public API: best-effort mapping of related hashtags into buckets.
         Returns a dict keyed by:
@@ -134,33 +121,31 @@ class RelationsMapper:
           - relatedAverage
           - relatedRare
         """
-        html = self.parser.fetch_hashtag_page(hashtag)
-        if html is None:
+        hashtag = page.hashtag
+        if page.html is None:
             logger.info(
                 "No HTML available for hashtag %s, skipping relation mapping.",
                 hashtag,
             )
             return self._bucketize_related_tags([])
 
-        payload = self._extract_json_from_html(html)
-        if not payload:
+        if not page.payload:
             logger.info(
                 "No JSON payload available for hashtag %s, skipping relation mapping.",
                 hashtag,
             )
             return self._bucketize_related_tags([])
 
-        node = self._extract_hashtag_node(payload)
-        if not node:
+        if not page.node:
             logger.info(
                 "No hashtag node found for %s, skipping relation mapping.", hashtag
             )
             return self._bucketize_related_tags([])
 
-        related_tags = self._collect_related_tags(node)
+        related_tags = self._collect_related_tags(page.node)
         logger.debug(
             "Collected %s raw related tags for hashtag %s.",
             len(related_tags),
             hashtag,
         )
-        return self._bucketize_related_tags(related_tags)
\ No newline at end of file
+        return self._bucketize_related_tags(related_tags)
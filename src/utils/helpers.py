@@ -1,28 +1,57 @@
 from __future__ import annotations
 
-import json
+import copy
+import functools
+import io
 import logging
+import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders second-granularity timestamps once per second
+    instead of calling localtime/strftime for every record.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._cached_time: Tuple[int, str] = (-1, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        # The default format includes milliseconds, so only cache datefmt.
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second == cached_second:
+            return cached_text
+
+        text = super().formatTime(record, datefmt)
+        self._cached_time = (second, text)
+        return text
 
 # Configure a shared logger for the entire project
 logger = logging.getLogger("instagram_hashtag_scraper")
 if not logger.handlers:
     handler = logging.StreamHandler()
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         "[%(asctime)s] [%(levelname)s] %(name)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     handler.setFormatter(formatter)
     logger.addHandler(handler)
-logger.setLevel(logging.INFO)
+# Library default; the CLI entry point raises verbosity to INFO.
+logger.setLevel(logging.WARNING)
 
-def load_settings(path: Path) -> Dict[str, Any]:
-    """
-    Load JSON settings from disk, with sensible defaults if the file
-    cannot be read.
-    """
-    default_settings: Dict[str, Any] = {
+# Built once and read-only; load_settings hands out mutable copies.
+_DEFAULT_SETTINGS: Mapping[str, Any] = MappingProxyType(
+    {
         "instagram_base_url": "https://www.instagram.com",
         "request_timeout": 10,
         "max_retries": 3,
@@ -33,76 +62,113 @@ def load_settings(path: Path) -> Dict[str, Any]:
             "Chrome/124.0 Safari/537.36"
         ),
         "output_dir": "../data",
+        "max_workers": 16,
     }
+)
 
-    if not path.exists():
-        logger.warning(
-            "Settings file %s not found. Using default settings.", path
-        )
-        return default_settings
+@functools.lru_cache(maxsize=8)
+def _read_settings_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a settings file. The modification time and size are only part of
+    the cache key, so editing the file invalidates the cached entry.
+    """
+    # Imported here so callers that never load settings skip the import.
+    try:
+        from orjson import loads
+    except ImportError:  # pragma: no cover - optional, faster JSON parser
+        from json import loads
+
+    return loads(Path(path_str).read_bytes())
 
+def load_settings(path: Path) -> Dict[str, Any]:
+    """
+    Load JSON settings from disk, with sensible defaults if the file
+    cannot be read.
+    """
     try:
-        with path.open("r", encoding="utf-8") as f:
-            loaded = json.load(f)
+        # A single stat both checks existence and keys the parse cache.
+        stat = path.stat()
+        # Copy so callers mutating the result cannot poison the cache.
+        loaded = copy.deepcopy(
+            _read_settings_cached(str(path), stat.st_mtime_ns, stat.st_size)
+        )
         if not isinstance(loaded, dict):
             logger.warning(
                 "Settings file %s is not a JSON object. Using defaults.", path
             )
-            return default_settings
-        default_settings.update(loaded)
-        return default_settings
+            return dict(_DEFAULT_SETTINGS)
+        settings = dict(_DEFAULT_SETTINGS)
+        settings.update(loaded)
+        return settings
+    except FileNotFoundError:
+        logger.warning(
+            "Settings file %s not found. Using default settings.", path
+        )
+        return dict(_DEFAULT_SETTINGS)
     except Exception as exc:
         logger.error("Failed to load settings from %s: %s", path, exc)
-        return default_settings
+        return dict(_DEFAULT_SETTINGS)
+
+# Anchor for relative output directories, resolved once at import.
+_REPO_ROOT = os.fspath(Path(__file__).resolve().parents[2])
+
+# Output directories already created (or found) by this process.
+_ENSURED_DIRS: Set[str] = set()
 
 def resolve_output_dir(settings: Dict[str, Any], override: str | None) -> Path:
     """
     Decide where to write output files, using either an explicit override
     from CLI or the output_dir entry from settings.json.
     """
-    if override:
-        output_dir = Path(override).expanduser()
-    else:
-        output_dir_value = settings.get("output_dir", "../data")
-        output_dir = Path(output_dir_value).expanduser()
+    # Work on plain strings and build the Path once at the end.
+    output_dir_value = os.fspath(override or settings.get("output_dir", "../data"))
+    # expanduser consults the environment; only pay for it when needed.
+    if "~" in output_dir_value:
+        output_dir_value = os.path.expanduser(output_dir_value)
 
     # Make path relative to this file's parent when not absolute
-    if not output_dir.is_absolute():
-        output_dir = Path(__file__).resolve().parents[2] / output_dir
+    if not os.path.isabs(output_dir_value):
+        output_dir_value = os.path.join(_REPO_ROOT, output_dir_value)
+    output_dir = Path(output_dir_value)
+
+    # Only hit the filesystem the first time a directory is seen.
+    if output_dir_value not in _ENSURED_DIRS:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(output_dir_value)
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    logger.info("Resolved output directory to %s", output_dir)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Resolved output directory to %s", output_dir)
     return output_dir
 
-def load_hashtag_list(path: Path | str) -> List[str]:
+def _parse_tag(line: str) -> str:
+    """
+    Return the hashtag on one line of a hashtag list, or an empty string
+    for blank lines and comment lines ('// ...' or '# ...').
+    """
+    raw = line.strip()
+    if not raw or raw.startswith(("# ", "//")):
+        return ""
+    return raw.lstrip("#").strip() if raw[0] == "#" else raw
+
+def load_hashtag_list(path: Path | str) -> Tuple[str, ...]:
     """
     Read a newline-delimited list of hashtags from a text file.
     Blank lines and comment-style lines starting with '#' are ignored.
     """
     p = Path(path)
-    items: List[str] = []
-    with p.open("r", encoding="utf-8") as f:
-        for line in f:
-            raw = line.strip()
-            if not raw:
-                continue
-            if raw.startswith("//"):
-                continue
-            # Allow comment-style lines that start with '# ' but keep pure tags
-            if raw.startswith("# ") or raw.startswith("//"):
-                continue
-            tag = raw.lstrip("#").strip()
-            if tag:
-                items.append(tag)
-    # Deduplicate while preserving order
-    seen = set()
-    deduped: List[str] = []
-    for tag in items:
-        if tag not in seen:
-            seen.add(tag)
-            deduped.append(tag)
-    return deduped
+    # One-shot read; StringIO with newline=None splits on \n, \r\n and \r
+    # like a text-mode file, unlike str.splitlines().
+    text = p.read_bytes().decode("utf-8")
+    # map/filter keep the per-line loop in C, and dict.fromkeys deduplicates
+    # while preserving first-seen order. Only the unique tags are interned,
+    # since they are used as dict keys downstream, where lookups can then
+    # match on identity.
+    tags = dict.fromkeys(filter(None, map(_parse_tag, io.StringIO(text, newline=None))))
+    return tuple(map(sys.intern, tags))
 
+_UNITS = (("", 1), ("K", 1e3), ("M", 1e6), ("G", 1e9), ("T", 1e12))
+
+@functools.lru_cache(maxsize=4096)
 def humanize_posts_count(value: int) -> str:
     """
     Turn a large integer into a compact human-readable unit, such as:
@@ -110,7 +176,23 @@ def humanize_posts_count(value: int) -> str:
       5600000   -> "5.6 M"
       2150000000 -> "2.15 G"
     """
-    units = ["", "K", "M", "G", "T"]
-    n = float(value)
-    unit_idx = 0
-    while abs(n) >= 1000 and unit_idx < len(units) - 1:
\ No newline at end of file
+    magnitude = abs(int(value))
+    if magnitude < 1000:
+        return str(int(value))
+    # Each group of three digits moves one unit up; the digit count is exact
+    # where log10 on large floats can round across a boundary.
+    unit, divisor = _UNITS[min(len(_UNITS) - 1, (len(str(magnitude)) - 1) // 3)]
+    return f"{value / divisor:.2f} {unit}"
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterable[List[Any]]:
+    """
+    Yield lists of up to `size` items from the input iterable.
+    """
+    chunk: List[Any] = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk